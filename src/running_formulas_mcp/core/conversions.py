@@ -1,5 +1,10 @@
 """Pace and speed conversion utilities."""
 
+# 1 mile = 1.609344 km. The reciprocal is precomputed so the mile->km
+# direction multiplies instead of dividing on every call.
+_KM_PER_MILE = 1.609344
+_MILES_PER_KM = 1.0 / _KM_PER_MILE
+
 
 def pace_min_km_to_min_mile(pace_min_km: float) -> float:
     """
@@ -11,8 +16,7 @@ def pace_min_km_to_min_mile(pace_min_km: float) -> float:
     Returns:
         float: Pace in minutes per mile.
     """
-    # 1 mile = 1.609344 km
-    return pace_min_km * 1.609344
+    return pace_min_km * _KM_PER_MILE
 
 
 def pace_min_mile_to_min_km(pace_min_mile: float) -> float:
@@ -25,8 +29,7 @@ def pace_min_mile_to_min_km(pace_min_mile: float) -> float:
     Returns:
         float: Pace in minutes per kilometer.
     """
-    # 1 mile = 1.609344 km
-    return pace_min_mile / 1.609344
+    return pace_min_mile * _MILES_PER_KM
 
 
 def pace_to_speed_kmh(pace_min_km: float) -> float:
@@ -103,8 +106,7 @@ def kmh_to_mph(speed_kmh: float) -> float:
     Returns:
         float: Speed in miles per hour.
     """
-    # 1 mile = 1.609344 km
-    return speed_kmh / 1.609344
+    return speed_kmh * _MILES_PER_KM
 
 
 def mph_to_kmh(speed_mph: float) -> float:
@@ -117,6 +119,5 @@ def mph_to_kmh(speed_mph: float) -> float:
     Returns:
         float: Speed in kilometers per hour.
     """
-    # 1 mile = 1.609344 km
-    return speed_mph * 1.609344
+    return speed_mph * _KM_PER_MILE
 
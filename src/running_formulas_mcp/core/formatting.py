@@ -1,5 +1,20 @@
 """Time and pace formatting utilities."""
 
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=4096)
+def _minutes_seconds(total_seconds: int) -> str:
+    """Cached "M:SS" string for a whole number of seconds.
+
+    Pace strings draw from a small range of second values, so each
+    distinct value is formatted once and then served from the cache.
+    """
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes}:{seconds:02d}"
+
 
 def time_in_hhmmss(seconds: float) -> str:
     """
@@ -11,9 +26,8 @@ def time_in_hhmmss(seconds: float) -> str:
     Returns:
         str: Formatted time as HH:MM:SS with zero-padded hours.
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
 
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
@@ -28,33 +42,41 @@ def pace_in_min_km(pace_per_km: float) -> str:
     Returns:
         str: Formatted pace as M:SS per km.
     """
-    minutes = int(pace_per_km // 1)
-    seconds = round((pace_per_km % 1) * 60)
+    # Rounding to whole seconds before splitting makes a 60-second
+    # rollover impossible, so no carry branch is needed.
+    return _minutes_seconds(round(pace_per_km * 60))
 
-    # Handle seconds rollover (60 seconds = 1 minute)
-    if seconds == 60:
-        minutes += 1
-        seconds = 0
 
-    return f"{minutes}:{seconds:02d}"
+def format_paces(paces_minutes) -> list[str]:
+    """
+    Format a batch of paces from decimal minutes to M:SS strings.
+
+    The split into minutes and seconds runs vectorized over the whole
+    batch, so formatting a full training table costs one NumPy divmod
+    plus a single string pass. Matches pace_in_min_km element by element.
+
+    Args:
+        paces_minutes: Paces in decimal minutes (array-like).
+
+    Returns:
+        list[str]: Formatted paces as "M:SS", one per input.
+    """
+    total_seconds = np.rint(np.asarray(paces_minutes) * 60).astype(np.int64)
+    minutes, seconds = np.divmod(total_seconds, 60)
+
+    # tolist() converts to plain ints up front, avoiding per-element
+    # NumPy scalar unboxing inside the formatting loop.
+    return [f"{m}:{s:02d}" for m, s in zip(minutes.tolist(), seconds.tolist())]
 
 
 def pace_in_min_sec(pace_minutes: float) -> str:
     """
     Format decimal minutes to pace string in M:SS format.
-    
+
     Args:
         pace_minutes: Pace in decimal minutes.
-        
+
     Returns:
         str: Formatted pace as "M:SS".
     """
-    minutes = int(pace_minutes)
-    seconds = int((pace_minutes - minutes) * 60)
-    
-    # Handle rounding edge case
-    if seconds >= 60:
-        minutes += 1
-        seconds = 0
-        
-    return f"{minutes}:{seconds:02d}"
+    return _minutes_seconds(int(pace_minutes * 60))
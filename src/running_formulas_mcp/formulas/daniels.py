@@ -1,6 +1,26 @@
-"""Jack Daniels' formulas for VDOT, training paces, and race predictions."""
+"""Jack Daniels' formulas for VDOT, training paces, and race predictions.
 
-import math
+All functions are written in terms of NumPy ufuncs, so they accept either
+scalars or NumPy arrays and broadcast elementwise. Batch callers (e.g. a
+training-pace table over many VDOTs) can pass an array and get one
+vectorized evaluation instead of a Python loop.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+
+class DanielsPaces(NamedTuple):
+    """All Daniels training paces for one VDOT and distance, in minutes."""
+
+    easy_fast: float
+    easy_slow: float
+    marathon: float
+    threshold: float
+    interval: float
+    repetition: float
 
 
 def calculate_vdot_from_performance(distance: float, time: float) -> float:
@@ -17,7 +37,7 @@ def calculate_vdot_from_performance(distance: float, time: float) -> float:
     t_min = time / 60
     v = distance / t_min
     vo2 = -4.6 + 0.182258 * v + 0.000104 * v * v
-    vo2max = 0.8 + 0.1894393 * math.exp(-0.012778 * t_min) + 0.2989558 * math.exp(-0.1932605 * t_min)
+    vo2max = 0.8 + 0.1894393 * np.exp(-0.012778 * t_min) + 0.2989558 * np.exp(-0.1932605 * t_min)
     return vo2 / vo2max
 
 
@@ -31,7 +51,7 @@ def get_pace_velocity(vdot_val: float) -> float:
     Returns:
         float: Velocity in meters per minute.
     """
-    return 29.54 + 5.000663 * vdot_val - 0.007546 * (vdot_val ** 2)
+    return 29.54 + 5.000663 * vdot_val - 0.007546 * vdot_val * vdot_val
 
 
 def get_custom_effort_pace(vdot_val: float, distance: float, effort_percentage: float) -> float:
@@ -66,37 +86,118 @@ def predict_time_daniels(current_distance: float, current_time: float, target_di
     """
     # Calculate VDOT from current performance
     vdot = calculate_vdot_from_performance(current_distance, current_time)
-    
-    # Calculate time for target distance using 100% effort (1.0)
-    time_minutes = get_custom_effort_pace(vdot, target_distance, 1.0)
+
+    # At 100% effort the pace is simply distance over the VDOT velocity,
+    # so the effort-scaling indirection is skipped.
+    time_minutes = target_distance / get_pace_velocity(vdot)
     return time_minutes * 60  # Convert minutes to seconds
 
 
+def predict_times_daniels(current_distance: float, current_time: float, target_distances) -> np.ndarray:
+    """
+    Predict race times for many target distances in one call.
+
+    VDOT and the 100%-effort velocity depend only on the known
+    performance, so they are computed once and broadcast over the whole
+    distance array instead of being re-derived per target.
+
+    Args:
+        current_distance: Distance of known performance in meters.
+        current_time: Time of known performance in seconds.
+        target_distances: Distances for race time prediction in meters.
+
+    Returns:
+        np.ndarray: Predicted times in seconds, one per target distance.
+    """
+    vdot = calculate_vdot_from_performance(current_distance, current_time)
+    velocity = get_pace_velocity(vdot)  # meters per minute
+    return np.asarray(target_distances) / velocity * 60
+
+
+def make_predictor(target_distance: float):
+    """
+    Build a race-time predictor specialized for a fixed target distance.
+
+    The returned closure bakes the target distance in, so callers that
+    repeatedly predict for the same distance (5K, 10K, half, full) skip
+    one argument pass and the distance lookup per call.
+
+    Args:
+        target_distance: Distance for race time prediction in meters.
+
+    Returns:
+        Callable[[float, float], float]: Function mapping a known
+        (distance, time) performance to the predicted time in seconds.
+    """
+    def predict(current_distance: float, current_time: float) -> float:
+        vdot = calculate_vdot_from_performance(current_distance, current_time)
+        return target_distance / get_pace_velocity(vdot) * 60
+
+    return predict
+
+
+# Predictors for the common race distances, specialized once at import.
+PREDICTORS = {
+    distance: make_predictor(distance)
+    for distance in (1500, 5000, 10000, 21097.5, 42195)
+}
+
+
 def get_marathon_velocity(vdot_val: float) -> float:
     """
     Calculate marathon velocity using iterative method from Jack Daniels.
-    
+
     Args:
         vdot_val: VDOT value.
-        
+
     Returns:
         float: Marathon velocity in meters per minute.
     """
+    if isinstance(vdot_val, np.ndarray):
+        return _solve_marathon_velocity(vdot_val)
+
+    # Scalar calls go through a cache keyed on the VDOT quantized to 0.01
+    # steps, so repeated solves for the same fitness level (e.g. marathon
+    # pace at several distances) become hash lookups.
+    return _marathon_velocity_cached(round(vdot_val * 100))
+
+
+@lru_cache(maxsize=1024)
+def _marathon_velocity_cached(vdot_q: int) -> float:
+    """Memoized Newton solve for a VDOT quantized to 0.01 steps."""
+    return _solve_marathon_velocity(vdot_q / 100)
+
+
+# Pre-combined literal products for the Newton refinement below, so the
+# loop body does not redo constant multiplications per iteration.
+_D_EXP1 = 0.298956 * 0.19326    # derivative coefficient of the exp1 term
+_D_EXP2 = 0.189439 * 0.012778   # derivative coefficient of the exp2 term
+_D_VEL = -0.007546 * 3          # derivative coefficient of the velocity term
+
+
+def _solve_marathon_velocity(vdot_val: float) -> float:
+    """Newton solve for marathon velocity, elementwise over arrays."""
     marathon_distance = 42195  # meters
     time_estimate = marathon_distance / (4 * vdot_val)
 
-    # Iterative refinement (3 iterations as in reference)
+    # Iterative refinement (3 iterations as in reference). The exponentials
+    # are evaluated once per iteration and reused between the correction
+    # factor and its derivative. Newton converges in the fixed iteration
+    # count, so the loop needs no early-exit branch and works elementwise
+    # on arrays as well as scalars.
+    exp = np.exp
     for _ in range(3):
-        exp1 = math.exp(-0.193261 * time_estimate)
-        correction_factor = 0.298956 * exp1 + math.exp(-0.012778 * time_estimate) * 0.189439 + 0.8
-        velocity = (vdot_val * correction_factor) ** 2 * (-0.0075) + vdot_val * correction_factor * 5.000663 + 29.54
+        exp1 = exp(-0.193261 * time_estimate)
+        exp2 = exp(-0.012778 * time_estimate)
+        correction_factor = 0.298956 * exp1 + exp2 * 0.189439 + 0.8
+        vv = vdot_val * correction_factor
+        velocity = vv * vv * (-0.0075) + vv * 5.000663 + 29.54
 
         # Calculate derivatives for Newton's method
-        d1 = 0.298956 * exp1 * 0.19326
-        d2 = d1 - math.exp(-0.012778 * time_estimate) * 0.189439 * (-0.012778)
-        d3 = correction_factor * d2 * vdot_val * (-0.007546) * 3
+        d2 = _D_EXP1 * exp1 + _D_EXP2 * exp2
+        d3 = correction_factor * d2 * vdot_val * _D_VEL
         d4 = d2 * vdot_val * 5.000663 + d3
-        d5 = marathon_distance * d4 / (velocity ** 2) + 1
+        d5 = marathon_distance * d4 / (velocity * velocity) + 1
 
         delta = time_estimate - marathon_distance / velocity
         adjustment = delta / d5
@@ -116,7 +217,7 @@ def is_slow_vdot(vdot_val: float, limit: float = 39) -> bool:
     Returns:
         bool: True if VDOT is below the slow runner limit.
     """
-    return 0 < vdot_val < limit
+    return (vdot_val > 0) & (vdot_val < limit)
 
 
 def get_slow_runner_vdot(vdot_val: float) -> float:
@@ -132,6 +233,11 @@ def get_slow_runner_vdot(vdot_val: float) -> float:
     return vdot_val * 2 / 3 + 13
 
 
+def _adjusted_vdot(vdot_val: float) -> float:
+    """Effective VDOT after the slow-runner adjustment, elementwise."""
+    return np.where(is_slow_vdot(vdot_val), get_slow_runner_vdot(vdot_val), vdot_val)
+
+
 def get_easy_pace(vdot_val: float, distance: float, is_slow_version: bool = False) -> float:
     """
     Calculate easy pace using Jack Daniels' methodology.
@@ -144,8 +250,7 @@ def get_easy_pace(vdot_val: float, distance: float, is_slow_version: bool = Fals
     Returns:
         float: Time in minutes for the given distance.
     """
-    if is_slow_vdot(vdot_val):
-        vdot_val = get_slow_runner_vdot(vdot_val)
+    vdot_val = _adjusted_vdot(vdot_val)
 
     effort = 0.62 if is_slow_version else 0.7
     return get_custom_effort_pace(vdot_val, distance, effort)
@@ -162,9 +267,9 @@ def get_threshold_pace(vdot_val: float, distance: float) -> float:
     Returns:
         float: Time in minutes for the given distance.
     """
-    if is_slow_vdot(vdot_val):
-        sr_vdot = get_slow_runner_vdot(vdot_val)
-        vdot_val = (sr_vdot + float(vdot_val)) / 2
+    # Slow runners use the average of the adjusted and raw VDOT:
+    # (v * 2/3 + 13 + v) / 2 folded into a single affine blend.
+    vdot_val = np.where(is_slow_vdot(vdot_val), vdot_val * (5 / 6) + 6.5, vdot_val)
 
     return get_custom_effort_pace(vdot_val, distance, 0.88)
 
@@ -180,8 +285,7 @@ def get_interval_pace(vdot_val: float, distance: float) -> float:
     Returns:
         float: Time in minutes for the given distance.
     """
-    if is_slow_vdot(vdot_val):
-        vdot_val = get_slow_runner_vdot(vdot_val)
+    vdot_val = _adjusted_vdot(vdot_val)
 
     return get_custom_effort_pace(vdot_val, distance, 0.975)
 
@@ -202,6 +306,37 @@ def get_repetition_pace(vdot_val: float, distance: float) -> float:
     return interval_pace - adjustment
 
 
+def get_all_paces(vdot_val: float, distance: float) -> DanielsPaces:
+    """
+    Calculate all Daniels training paces for a distance in one pass.
+
+    The slow-runner adjustment is evaluated once and shared across the
+    pace flavors instead of being re-derived by each individual pace
+    function, so a "all paces for one VDOT" request does a fifth of the
+    dispatch work.
+
+    Args:
+        vdot_val: VDOT value.
+        distance: Distance in meters.
+
+    Returns:
+        DanielsPaces: Times in minutes for the given distance.
+    """
+    v_adjusted = _adjusted_vdot(vdot_val)
+    v_threshold = np.where(is_slow_vdot(vdot_val), vdot_val * (5 / 6) + 6.5, vdot_val)
+
+    interval = get_custom_effort_pace(v_adjusted, distance, 0.975)
+
+    return DanielsPaces(
+        easy_fast=get_custom_effort_pace(v_adjusted, distance, 0.7),
+        easy_slow=get_custom_effort_pace(v_adjusted, distance, 0.62),
+        marathon=distance / get_marathon_velocity(vdot_val),
+        threshold=get_custom_effort_pace(v_threshold, distance, 0.88),
+        interval=interval,
+        repetition=interval - distance / 400 * (6 / 60),
+    )
+
+
 def get_marathon_pace(vdot_val: float, distance: float) -> float:
     """
     Calculate marathon pace using Jack Daniels' methodology.
@@ -13,9 +13,13 @@ Note: This implementation closely approximates McMillan's calculations based on
 publicly available information.
 """
 
+import bisect
+import copy
+import math
 import numpy as np
 import os
-import joblib
+import pickle
+from functools import lru_cache
 
 # ============================================================================
 # CUSTOM EXCEPTIONS
@@ -50,17 +54,27 @@ class PredictionError(McMillanCalculationError):
 # CONSTANTS AND CONFIGURATION
 # ============================================================================
 
-# Heart rate estimation formulas
-MAX_HR_FORMULAS = {
-    'londeree': lambda age: 206.3 - (0.711 * age),
-    'miller': lambda age: 217 - (0.85 * age),
-    'jackson': lambda age: 206.9 - (0.67 * age),
-    'whyte': lambda age: 202 - (0.55 * age),
-    'oakland': lambda age: 191.5 - (0.007 * (age * age)),
-    'tanaka': lambda age: 208 - (0.7 * age),
-    'wisloff': lambda age: 211 - (0.64 * age),
-    'robergs': lambda age: 205.8 - (0.685 * age),
-}
+# Heart rate estimation formulas, each of the form max HR = a*age + b + q*age^2.
+# The coefficients are kept in parallel arrays so all eight formulas evaluate
+# in a single vectorized expression instead of eight Python calls.
+MAX_HR_FORMULA_NAMES = ('londeree', 'miller', 'jackson', 'whyte', 'oakland', 'tanaka', 'wisloff', 'robergs')
+_MAX_HR_A = np.array([-0.711, -0.85, -0.67, -0.55, 0.0, -0.7, -0.64, -0.685])
+_MAX_HR_B = np.array([206.3, 217.0, 206.9, 202.0, 191.5, 208.0, 211.0, 205.8])
+_MAX_HR_Q = np.array([0.0, 0.0, 0.0, 0.0, -0.007, 0.0, 0.0, 0.0])
+
+
+def compute_max_hr(age: float) -> dict:
+    """
+    Evaluate all max heart rate estimation formulas for a given age.
+
+    Args:
+        age: Age in years (scalar or NumPy array; arrays broadcast).
+
+    Returns:
+        dict: Estimated max heart rate in BPM keyed by formula name.
+    """
+    estimates = _MAX_HR_A * age + _MAX_HR_B + _MAX_HR_Q * (age * age)
+    return dict(zip(MAX_HR_FORMULA_NAMES, estimates))
 
 # Standard race distances for predictions
 RACE_DISTANCES = {
@@ -74,6 +88,12 @@ RACE_DISTANCES = {
     "50 Miles": 80467, "100km": 100000, "100 Miles": 160934,
 }
 
+# Parallel views of RACE_DISTANCES for the prediction loop: fixed tuples
+# iterate faster than dict items and avoid per-call name lookups.
+_RACE_NAMES = tuple(RACE_DISTANCES)
+_RACE_METERS = tuple(RACE_DISTANCES.values())
+_METERS_TO_NAME = {meters: name for name, meters in RACE_DISTANCES.items()}
+
 # Heart rate zone definitions
 HR_ZONE_DEFINITIONS = {
     "endurance": {
@@ -97,6 +117,33 @@ HR_ZONE_DEFINITIONS = {
     }
 }
 
+# Structure-of-arrays views of HR_ZONE_DEFINITIONS: one flat index of
+# (group, name, description) plus aligned arrays of the four percentage
+# bounds (pre-divided by 100), so the zone math runs as four vector ops
+# instead of a Python loop of scalar multiplies and rounds.
+_HR_ZONE_INDEX = tuple(
+    (zone_group, zone_name, zone_data["description"])
+    for zone_group, zones in HR_ZONE_DEFINITIONS.items()
+    for zone_name, zone_data in zones.items()
+)
+_HR_GROUP_DESCRIPTIONS = {
+    zone_group: f"{zone_group.title()} Zone training"
+    for zone_group in HR_ZONE_DEFINITIONS
+}
+
+# Pre-bound formatter for the BPM range strings in the zone builder: one
+# C-level str.format call per range instead of f-string field formatting.
+_RANGE_FMT = "{}-{} BPM".format
+_HRMAX_MIN_FRAC, _HRMAX_MAX_FRAC, _HRRES_MIN_FRAC, _HRRES_MAX_FRAC = (
+    np.array(column, dtype=np.float64) / 100
+    for column in zip(*(
+        (zone_data["hrmax"][0], zone_data["hrmax"][1],
+         zone_data["hrreserve"][0], zone_data["hrreserve"][1])
+        for zones in HR_ZONE_DEFINITIONS.values()
+        for zone_data in zones.values()
+    ))
+)
+
 # Training zone name mappings
 ZONE_NAME_MAPPINGS = {
     'endurance': {'recovery': 'recovery_jogs', 'easy': 'easy_runs', 'long': 'long_runs'},
@@ -121,6 +168,13 @@ VALIDATION_LIMITS = {
     'max_pace_per_km': 1200,  # seconds (20:00/km)
 }
 
+# Limits hoisted out of the dict once, so the per-call validation in
+# _assert_inputs is plain comparisons with no dict lookups.
+_MIN_DISTANCE = VALIDATION_LIMITS['min_distance']
+_MAX_DISTANCE = VALIDATION_LIMITS['max_distance']
+_MIN_PACE_PER_KM = VALIDATION_LIMITS['min_pace_per_km']
+_MAX_PACE_PER_KM = VALIDATION_LIMITS['max_pace_per_km']
+
 # Riegel's formula exponent
 RIEGEL_EXPONENT = 1.06
 
@@ -198,45 +252,152 @@ def predict_race_times(distance_meters: float, time_seconds: float) -> dict:
 
     _assert_inputs(distance_meters, time_seconds)
 
-    available_input_distances = _available_model_distances("race_times")
-    (normalized_distance, normalized_time) = _normalize_inputs(available_input_distances, distance_meters, time_seconds)
+    return {
+        race_name: format_pace_hms(predicted_seconds)
+        for race_name, predicted_seconds in _predict_race_seconds_cached(distance_meters, time_seconds).items()
+    }
 
-    predicted_race_times = {}
-    for race_name, output_distance in RACE_DISTANCES.items():
-        # If the race to predict is the user's input race, just use the original time
-        if output_distance == int(distance_meters):
-            predicted_race_times[race_name] = format_pace_hms(time_seconds)
-            continue
 
-        model = _get_race_time_model(normalized_distance, race_name)
+def predict_race_times_seconds(distance_meters: float, time_seconds: float) -> dict:
+    """
+    Predict race times for all standard distances, in raw seconds.
 
-        try:
-            predicted_time = _predict_with_model(normalized_time, model)
-            if not np.isnan(predicted_time):
-                predicted_race_times[race_name] = format_pace_hms(predicted_time)
-        except Exception:
-            continue
+    Numeric sibling of predict_race_times for callers that consume the
+    predictions programmatically and would otherwise round-trip through
+    the HH:MM:SS strings.
 
-    return predicted_race_times
+    Args:
+        distance_meters: Race distance in meters (input for the model).
+        time_seconds: Race time in seconds (input for the model).
 
+    Returns:
+        dict: Dictionary with distance names as keys and predicted times
+              as values in seconds.
 
-def _calculate_velocity_marker(distance_meters: float, time_seconds: float, marker_type: str) -> int:
+    Raises:
+        InvalidInputError: If distance or time is not positive or if inputs are unrealistic.
+    """
     _assert_inputs(distance_meters, time_seconds)
 
-    available_input_distances = _available_model_distances("velocity_markers")
-    (normalized_distance, normalized_time) = _normalize_inputs(available_input_distances, distance_meters, time_seconds)
+    return dict(_predict_race_seconds_cached(distance_meters, time_seconds))
+
+
+@lru_cache(maxsize=256)
+def _predict_race_seconds_cached(distance_meters: float, time_seconds: float) -> dict:
+    """Predict race times in seconds for already-validated inputs."""
+    normalized_distance = _closest_model_distance("race_times", distance_meters)
+    normalized_time = _normalize_time(distance_meters, time_seconds, normalized_distance)
+
+    # Evaluate all race polynomials at once: a single Horner pass over the
+    # cached coefficient matrix replaces one scalar model evaluation per
+    # race distance.
+    coef_matrix = _race_time_matrix(normalized_distance)
+    predicted_times = np.zeros(coef_matrix.shape[0])
+    for j in range(coef_matrix.shape[1]):
+        predicted_times = predicted_times * normalized_time + coef_matrix[:, j]
+    valid = np.isfinite(predicted_times)
 
-    # Load the functional model for the determined base distance and marker type
-    model = _get_velocity_marker_model(normalized_distance, marker_type)
+    # If the race to predict is the user's input race, just use the original
+    # time. The reverse map resolves that race once, before the loop.
+    passthrough_name = _METERS_TO_NAME.get(int(distance_meters))
 
-    # Predict VLT using the functional model
-    marker = _predict_with_model(normalized_time, model)
-    if np.isnan(marker):
+    predicted_race_seconds = {}
+    for i, race_name in enumerate(_RACE_NAMES):
+        if race_name == passthrough_name:
+            predicted_race_seconds[race_name] = time_seconds
+        elif valid[i]:
+            predicted_race_seconds[race_name] = float(predicted_times[i])
+
+    return predicted_race_seconds
+
+
+@lru_cache(maxsize=64)
+def _race_time_matrix(normalized_distance: int) -> np.ndarray:
+    """
+    Gather the race-time polynomial coefficients for one base distance
+    into a front-padded matrix for batched Horner evaluation.
+
+    Rows are ordered like _RACE_NAMES; shorter polynomials are padded
+    with leading zeros, which contribute nothing under Horner's scheme.
+
+    Args:
+        normalized_distance: Base distance in meters the models belong to.
+
+    Returns:
+        np.ndarray: Coefficient matrix of shape (n_races, width).
+    """
+    coefficient_rows = [
+        _get_race_time_model(normalized_distance, race_name)['coefficients']
+        for race_name in _RACE_NAMES
+    ]
+    width = max(len(row) for row in coefficient_rows)
+    coef_matrix = np.zeros((len(coefficient_rows), width))
+    for i, row in enumerate(coefficient_rows):
+        coef_matrix[i, width - len(row):] = row
+
+    return coef_matrix
+
+
+def _calculate_velocity_marker(distance_meters: float, time_seconds: float, marker_type: str) -> int:
+    _assert_inputs(distance_meters, time_seconds)
+
+    marker = _velocity_markers_cached(distance_meters, time_seconds)[_MARKER_ROW[marker_type]]
+    if math.isnan(marker):
         raise InvalidInputError(f"Failed to predict {marker_type} using model.")
 
     return round(marker)
 
 
+# Row order of the marker-coefficient matrix; all three markers share one
+# matrix so they can be evaluated in a single Horner pass.
+_MARKER_TYPES = ('vLT', 'CV', 'vVO2')
+_MARKER_ROW = {marker_type: row for row, marker_type in enumerate(_MARKER_TYPES)}
+
+
+@lru_cache(maxsize=256)
+def _velocity_markers_cached(distance_meters: float, time_seconds: float) -> tuple:
+    """Predict all velocity markers for already-validated inputs.
+
+    The three markers share the normalization and model lookup, so a
+    performance queried for CV and then vLT pays the model work once.
+    Failed predictions stay NaN; the public wrappers turn them into
+    InvalidInputError per marker.
+    """
+    normalized_distance = _closest_model_distance("velocity_markers", distance_meters)
+    normalized_time = _normalize_time(distance_meters, time_seconds, normalized_distance)
+
+    coef_matrix = _velocity_marker_matrix(normalized_distance)
+    markers = np.zeros(coef_matrix.shape[0])
+    for j in range(coef_matrix.shape[1]):
+        markers = markers * normalized_time + coef_matrix[:, j]
+
+    return tuple(float(marker) for marker in markers)
+
+
+@lru_cache(maxsize=64)
+def _velocity_marker_matrix(normalized_distance: int) -> np.ndarray:
+    """
+    Gather the velocity-marker polynomial coefficients for one base
+    distance into a front-padded matrix, rows ordered like _MARKER_TYPES.
+
+    Args:
+        normalized_distance: Base distance in meters the models belong to.
+
+    Returns:
+        np.ndarray: Coefficient matrix of shape (3, width).
+    """
+    coefficient_rows = [
+        _get_velocity_marker_model(normalized_distance, marker_type)['coefficients']
+        for marker_type in _MARKER_TYPES
+    ]
+    width = max(len(row) for row in coefficient_rows)
+    coef_matrix = np.zeros((len(coefficient_rows), width))
+    for i, row in enumerate(coefficient_rows):
+        coef_matrix[i, width - len(row):] = row
+
+    return coef_matrix
+
+
 def _assert_inputs(distance_meters: float, time_seconds: float):
     """
     Validate input parameters for distance and time.
@@ -248,30 +409,44 @@ def _assert_inputs(distance_meters: float, time_seconds: float):
     Raises:
         InvalidInputError: If inputs are invalid or unrealistic
     """
+    # Happy path: one combined check covering every rule. Nearly all calls
+    # pass, so valid inputs pay a single chained comparison; failures fall
+    # through to the slow path, which re-runs the rules individually to
+    # raise with the precise message.
+    if (
+        _MIN_DISTANCE <= distance_meters <= _MAX_DISTANCE
+        and time_seconds > 0
+        and _MIN_PACE_PER_KM <= time_seconds * 1000.0 / distance_meters <= _MAX_PACE_PER_KM
+    ):
+        return
+
+    _raise_invalid_inputs(distance_meters, time_seconds)
+
+
+def _raise_invalid_inputs(distance_meters: float, time_seconds: float):
+    """Diagnose which validation rule failed and raise its message."""
     if distance_meters <= 0:
         raise InvalidInputError("Distance must be positive")
     if time_seconds <= 0:
         raise InvalidInputError("Time must be positive")
 
-    # Add realistic range checking for distance
-    if distance_meters < VALIDATION_LIMITS['min_distance']:
-        raise InvalidInputError(f"Distance too short, must be at least {VALIDATION_LIMITS['min_distance']}m for meaningful calculations")
-    if distance_meters > VALIDATION_LIMITS['max_distance']:
-        raise InvalidInputError(f"Distance too long, must be less than {VALIDATION_LIMITS['max_distance']/1609.344:.0f} miles for this calculation method")
+    if distance_meters < _MIN_DISTANCE:
+        raise InvalidInputError(f"Distance too short, must be at least {_MIN_DISTANCE}m for meaningful calculations")
+    if distance_meters > _MAX_DISTANCE:
+        raise InvalidInputError(f"Distance too long, must be less than {_MAX_DISTANCE/1609.344:.0f} miles for this calculation method")
 
-    # Check for unrealistic paces
-    pace_per_km = time_seconds / (distance_meters / 1000)
-    if pace_per_km < VALIDATION_LIMITS['min_pace_per_km']:
-        min_pace_formatted = f"{VALIDATION_LIMITS['min_pace_per_km']//60}:{VALIDATION_LIMITS['min_pace_per_km']%60:02d}"
+    pace_per_km = time_seconds * 1000.0 / distance_meters
+    if pace_per_km < _MIN_PACE_PER_KM:
+        min_pace_formatted = f"{_MIN_PACE_PER_KM//60}:{_MIN_PACE_PER_KM%60:02d}"
         raise InvalidInputError(f"Pace appears unrealistically fast (faster than {min_pace_formatted}/km)")
-    if pace_per_km > VALIDATION_LIMITS['max_pace_per_km']:
-        max_pace_formatted = f"{VALIDATION_LIMITS['max_pace_per_km']//60}:{VALIDATION_LIMITS['max_pace_per_km']%60:02d}"
+    if pace_per_km > _MAX_PACE_PER_KM:
+        max_pace_formatted = f"{_MAX_PACE_PER_KM//60}:{_MAX_PACE_PER_KM%60:02d}"
         raise InvalidInputError(f"Pace appears unrealistically slow (slower than {max_pace_formatted}/km)")
 
 
-def _available_model_distances(model_type: str) -> list:
+def _available_model_distances(model_type: str) -> tuple:
     """
-    Returns a sorted list of available input distances for which we have functional models.
+    Returns a sorted tuple of available input distances for which we have functional models.
     This is used to determine the closest model base distance for normalization and prediction.
     """
     return _model_manager.get_available_distances(model_type)
@@ -287,6 +462,9 @@ class ModelManager:
 
     def __init__(self):
         self._models = {}
+        self._flat_models = {}
+        self._sorted_distances = {}
+        self._zone_distances = {}
         self._loaded = False
         self._model_path = os.path.join(os.path.dirname(__file__), "mcmillan.pkl")
 
@@ -303,7 +481,7 @@ class ModelManager:
             ModelLoadingError: If model loading fails
         """
         try:
-            self._models = joblib.load(self._model_path)
+            self._models = self._deserialize_models()
             if not self._models:
                 raise ModelLoadingError("Loaded models dictionary is empty")
 
@@ -313,15 +491,99 @@ class ModelManager:
             if missing_categories:
                 raise ModelLoadingError(f"Missing required model categories: {missing_categories}")
 
+            self._prepare_models()
             self._loaded = True
 
         except FileNotFoundError:
             raise ModelLoadingError(f"Models file not found at {self._model_path}")
-        except joblib.externals.loky.process_executor.TerminatedWorkerError:
+        except pickle.UnpicklingError:
             raise ModelLoadingError(f"Failed to deserialize models file at {self._model_path} - file may be corrupted")
         except Exception as e:
             raise ModelLoadingError(f"Unexpected error loading models: {e}")
 
+    def _deserialize_models(self):
+        """
+        Deserialize the model file, preferring the stdlib pickle fast path.
+
+        The model file is a plain dict of coefficients, so pickle.load
+        handles it directly; joblib.load would work too but drags in its
+        memmap detection and worker machinery on every cold start. joblib
+        remains the fallback in case the file was ever re-dumped with
+        joblib-specific array wrappers, and is imported lazily so the
+        common path never touches it.
+        """
+        try:
+            with open(self._model_path, 'rb') as model_file:
+                return pickle.load(model_file)
+        except pickle.UnpicklingError:
+            import joblib
+            return joblib.load(self._model_path)
+
+    def _prepare_models(self):
+        """
+        Pre-bake model parameters once after loading.
+
+        Polynomial coefficients arrive from the pickle as lists or NumPy
+        arrays; converting them to tuples of plain floats here means the
+        per-call Horner evaluation iterates native floats with no NumPy
+        scalar boxing, and the conversion cost is paid exactly once.
+        Coefficients are also checked for finiteness here, so prediction
+        paths can trust the loaded models instead of guarding every
+        evaluation.
+
+        Raises:
+            ModelLoadingError: If a polynomial model contains non-finite
+                coefficients.
+        """
+        stack = [self._models]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            if node.get('type') == 'polynomial' and 'coefficients' in node:
+                coefficients = tuple(float(c) for c in node['coefficients'])
+                if not all(math.isfinite(c) for c in coefficients):
+                    raise ModelLoadingError("Polynomial model contains non-finite coefficients")
+                node['coefficients'] = coefficients
+            else:
+                self._pair_fast_slow(node)
+                stack.extend(node.values())
+
+        self._sorted_distances = {}
+        self._zone_distances = {}
+
+        # Flatten the three-level tree into one tuple-keyed dict so the
+        # hot get_model path is a single hash lookup instead of three.
+        self._flat_models = {
+            (category, distance, key): model
+            for category, by_distance in self._models.items()
+            for distance, by_key in by_distance.items()
+            for key, model in by_key.items()
+        }
+
+    @staticmethod
+    def _pair_fast_slow(node: dict):
+        """
+        Pre-pair 'fast'/'slow' polynomial coefficients for fused evaluation.
+
+        Training pace models always come in fast/slow pairs evaluated at
+        the same input time. Zipping the (zero-padded) coefficients into
+        one tuple of pairs lets _predict_pace_from_models run both Horner
+        recurrences in a single loop instead of two model dispatches.
+        """
+        fast = node.get('fast')
+        slow = node.get('slow')
+        if not (isinstance(fast, dict) and fast.get('type') == 'polynomial' and 'coefficients' in fast
+                and isinstance(slow, dict) and slow.get('type') == 'polynomial' and 'coefficients' in slow):
+            return
+
+        fast_coeffs = tuple(float(c) for c in fast['coefficients'])
+        slow_coeffs = tuple(float(c) for c in slow['coefficients'])
+        width = max(len(fast_coeffs), len(slow_coeffs))
+        fast_coeffs = (0.0,) * (width - len(fast_coeffs)) + fast_coeffs
+        slow_coeffs = (0.0,) * (width - len(slow_coeffs)) + slow_coeffs
+        node['_fs_coefs'] = tuple(zip(fast_coeffs, slow_coeffs))
+
     def get_model(self, model_category: str, input_distance: int, model_key: str):
         """
         Retrieve a model from the loaded models with comprehensive error handling.
@@ -339,6 +601,12 @@ class ModelManager:
         """
         self._ensure_models_loaded()
 
+        try:
+            return self._flat_models[(model_category, input_distance, model_key)]
+        except KeyError:
+            pass
+
+        # Miss: walk the nested tree to report which level is missing.
         if model_category not in self._models:
             available_categories = list(self._models.keys())
             raise ModelNotFoundError(f"Model category '{model_category}' not found. Available categories: {available_categories}")
@@ -347,35 +615,40 @@ class ModelManager:
             available_distances = sorted(self._models[model_category].keys())
             raise ModelNotFoundError(f"No models found for distance {input_distance}m in category '{model_category}'. Available distances: {available_distances}")
 
-        if model_key not in self._models[model_category][input_distance]:
-            available_keys = list(self._models[model_category][input_distance].keys())
-            raise ModelNotFoundError(f"Model key '{model_key}' not found for {input_distance}m in category '{model_category}'. Available keys: {available_keys}")
+        available_keys = list(self._models[model_category][input_distance].keys())
+        raise ModelNotFoundError(f"Model key '{model_key}' not found for {input_distance}m in category '{model_category}'. Available keys: {available_keys}")
 
-        return self._models[model_category][input_distance][model_key]
-
-    def get_available_distances(self, model_category: str) -> list:
+    def get_available_distances(self, model_category: str) -> tuple:
         """
         Get available distances for a specific model category.
 
+        The sort happens once per category; subsequent calls return the
+        cached tuple.
+
         Args:
             model_category: Category of model to check
 
         Returns:
-            list: Sorted list of available distances
+            tuple: Sorted tuple of available distances
 
         Raises:
             ModelNotFoundError: If model category is not found
         """
         self._ensure_models_loaded()
 
+        distances = self._sorted_distances.get(model_category)
+        if distances is not None:
+            return distances
+
         if model_category not in self._models:
             available_categories = list(self._models.keys())
             raise ModelNotFoundError(f"Model category '{model_category}' not found. Available categories: {available_categories}")
 
-        distances = sorted(self._models[model_category].keys())
+        distances = tuple(sorted(self._models[model_category].keys()))
         if not distances:
             raise ModelNotFoundError(f"No models available for {model_category}.")
 
+        self._sorted_distances[model_category] = distances
         return distances
 
     def get_training_pace_zones(self) -> list:
@@ -412,6 +685,28 @@ class ModelManager:
                 return self._models["training_paces"][zone_key]
             return None
 
+    def get_zone_distances(self, zone_key) -> tuple:
+        """
+        Get the sorted distances modeled for a training pace zone.
+
+        Sorting happens once per zone key; the interpolation hot path
+        reuses the cached tuple on every subsequent call.
+
+        Args:
+            zone_key: Tuple of (zone_group, zone_type, zone_distance)
+
+        Returns:
+            tuple: Sorted distances for the zone, empty if zone is unknown
+        """
+        distances = self._zone_distances.get(zone_key)
+        if distances is not None:
+            return distances
+
+        distance_models = self.get_training_pace_models(zone_key)
+        distances = tuple(sorted(distance_models)) if distance_models else ()
+        self._zone_distances[zone_key] = distances
+        return distances
+
     @property
     def is_loaded(self) -> bool:
         """Check if models are loaded."""
@@ -422,30 +717,57 @@ class ModelManager:
         self._loaded = False
         self._models = {}
         self._ensure_models_loaded()
+        _race_time_matrix.cache_clear()
+        _velocity_marker_matrix.cache_clear()
+        _velocity_markers_cached.cache_clear()
+        _closest_model_distance.cache_clear()
+        _predict_race_seconds_cached.cache_clear()
+        _training_paces_cached.cache_clear()
 
 
 # Global model manager instance
 _model_manager = ModelManager()
 
-def _normalize_inputs(available_distances: dict, distance_meters: int, time_seconds: int) -> tuple[int, int]:
+
+def preload_models():
     """
-    Normalizes the inputs for the model prediction.
+    Load the McMillan models eagerly.
+
+    Model loading is lazy by default so importing this module (and the
+    MCP handshake) stays fast. Long-running deployments can call this
+    once at startup to move the one-time load cost out of the first
+    user request.
+    """
+    _model_manager._ensure_models_loaded()
+
+@lru_cache(maxsize=4096)
+def _closest_model_distance(model_category: str, distance_meters: float) -> int:
+    """
+    Find the closest input distance for which we have a model set.
+
+    The result only depends on the model category and input distance, so
+    it is memoized: repeated calls for the same athlete's race distance
+    across the public functions become hash lookups. The distances are
+    sorted, so the nearest one is one of the two bisect neighbors rather
+    than an O(N) min() scan.
 
     Args:
-        distance_meters: Distance in meters for which to retrieve the model.
+        model_category: Category of model ('velocity_markers', 'race_times', ...).
+        distance_meters: Distance in meters to match against the models.
 
     Returns:
-        dict: A dictionary containing the normalized time in seconds
+        int: The closest base distance with models in that category.
     """
+    available_distances = _available_model_distances(model_category)
 
-    # Find the closest input distance for which we have a model set. This will be our base model.
-    normalized_distance = min(available_distances, key=lambda x: abs(x - distance_meters))
-
-    if distance_meters == normalized_distance:
-        return (normalized_distance, time_seconds)
+    idx = bisect.bisect_left(available_distances, distance_meters)
+    if idx == 0:
+        return available_distances[0]
+    if idx == len(available_distances):
+        return available_distances[-1]
 
-    normalized_time = _normalize_time(distance_meters, time_seconds, normalized_distance)
-    return (normalized_distance, normalized_time)
+    lower, upper = available_distances[idx - 1], available_distances[idx]
+    return lower if distance_meters - lower <= upper - distance_meters else upper
 
 
 def _get_model(model_category: str, input_distance: int, model_key: str):
@@ -494,6 +816,27 @@ def _get_race_time_model(input_distance: int, event_name: str):
     return _get_model("race_times", input_distance, event_name)
 
 
+def _horner(coefficients, x: float) -> float:
+    """
+    Evaluate a polynomial at x by Horner's rule.
+
+    Coefficients are ordered highest degree first (np.poly1d order). The
+    kernel is a plain local-variable loop so repeated scalar evaluations
+    stay free of array allocation and attribute lookups.
+
+    Args:
+        coefficients: Polynomial coefficients, highest degree first.
+        x: Point at which to evaluate.
+
+    Returns:
+        float: The polynomial value at x.
+    """
+    result = 0.0
+    for coefficient in coefficients:
+        result = result * x + coefficient
+    return result
+
+
 def _predict_with_model(input_time: float, model_params: dict) -> float:
     """
     Predict a value using the specified model parameters.
@@ -519,10 +862,9 @@ def _predict_with_model(input_time: float, model_params: dict) -> float:
             raise PredictionError("Polynomial model missing 'coefficients' field")
 
         try:
-            poly_func = np.poly1d(model_params['coefficients'])
-            result = float(poly_func(input_time))
+            result = float(_horner(model_params['coefficients'], input_time))
 
-            if np.isnan(result) or np.isinf(result):
+            if not math.isfinite(result):
                 raise PredictionError(f"Model prediction resulted in invalid value: {result}")
 
             return result
@@ -585,7 +927,9 @@ def _interpolate_training_pace(zone_key, input_distance: float, input_time: floa
     if distance_models is None:
         return None
 
-    available_distances = sorted(distance_models.keys())
+    # Sorted once per zone key and cached on the manager, so the per-call
+    # work here is a bisect rather than a sort plus linear scans.
+    available_distances = _model_manager.get_zone_distances(zone_key)
     if not available_distances:
         return None
 
@@ -593,20 +937,15 @@ def _interpolate_training_pace(zone_key, input_distance: float, input_time: floa
     if input_distance in distance_models:
         return _predict_pace_from_models(input_time, distance_models[input_distance])
 
-    # Check if distance is within the available range
-    if input_distance < available_distances[0] or input_distance > available_distances[-1]:
-        # Use nearest distance
-        nearest_dist = min(available_distances, key=lambda x: abs(x - input_distance))
-        return _predict_pace_from_models(input_time, distance_models[nearest_dist])
+    # Outside the modeled range, the nearest distance is the closest endpoint
+    if input_distance < available_distances[0]:
+        return _predict_pace_from_models(input_time, distance_models[available_distances[0]])
+    if input_distance > available_distances[-1]:
+        return _predict_pace_from_models(input_time, distance_models[available_distances[-1]])
 
     # Interpolate between two distances
     lower_dist, upper_dist = _find_interpolation_bounds(available_distances, input_distance)
 
-    if lower_dist is None or upper_dist is None:
-        # Fallback to nearest distance
-        nearest_dist = min(available_distances, key=lambda x: abs(x - input_distance))
-        return _predict_pace_from_models(input_time, distance_models[nearest_dist])
-
     # Perform interpolation
     return _interpolate_between_distances(
         input_time, input_distance, lower_dist, upper_dist,
@@ -616,24 +955,30 @@ def _interpolate_training_pace(zone_key, input_distance: float, input_time: floa
 
 def _predict_pace_from_models(input_time: float, models: dict):
     """Predict fast and slow paces from model dictionary."""
-    fast_pace = _predict_with_model(input_time, models['fast'])
-    slow_pace = _predict_with_model(input_time, models['slow'])
+    pairs = models.get('_fs_coefs')
+    if pairs is None:
+        fast_pace = _predict_with_model(input_time, models['fast'])
+        slow_pace = _predict_with_model(input_time, models['slow'])
+        return (fast_pace, slow_pace)
+
+    # Fused Horner pass: both polynomials advance together over the
+    # pre-paired coefficients, halving loop and dispatch overhead.
+    fast_pace = slow_pace = 0.0
+    for coefficient_fast, coefficient_slow in pairs:
+        fast_pace = fast_pace * input_time + coefficient_fast
+        slow_pace = slow_pace * input_time + coefficient_slow
     return (fast_pace, slow_pace)
 
 
-def _find_interpolation_bounds(available_distances: list, input_distance: float):
-    """Find the lower and upper bounds for interpolation."""
-    lower_dist = None
-    upper_dist = None
-
-    for dist in available_distances:
-        if dist < input_distance:
-            lower_dist = dist
-        elif dist > input_distance:
-            upper_dist = dist
-            break
+def _find_interpolation_bounds(available_distances, input_distance: float):
+    """
+    Find the lower and upper bounds for interpolation.
 
-    return lower_dist, upper_dist
+    Callers guarantee input_distance lies strictly inside the sorted
+    available_distances, so a single bisect locates both neighbors.
+    """
+    index = bisect.bisect_left(available_distances, input_distance)
+    return available_distances[index - 1], available_distances[index]
 
 
 def _interpolate_between_distances(input_time: float, input_distance: float,
@@ -666,6 +1011,14 @@ def training_paces(distance_meters: float, time_seconds: float) -> dict:
     """
     _assert_inputs(distance_meters, time_seconds)
 
+    # Results are memoized per (distance, time); the deep copy keeps each
+    # caller's nested dict isolated from the cached original.
+    return copy.deepcopy(_training_paces_cached(distance_meters, time_seconds))
+
+
+@lru_cache(maxsize=256)
+def _training_paces_cached(distance_meters: float, time_seconds: float) -> dict:
+    """Calculate training paces for already-validated inputs."""
     # Initialize training pace structure
     training_paces = _initialize_training_pace_structure()
 
@@ -743,10 +1096,29 @@ def _initialize_training_pace_structure() -> dict:
     }
 
 
+@lru_cache(maxsize=None)
+def _distance_key(zone_distance: int) -> str:
+    """Cached "<distance>m" key string for a zone distance."""
+    return f"{zone_distance}m"
+
+
+@lru_cache(maxsize=None)
+def _zone_display(zone_group: str, zone_type: str) -> tuple:
+    """
+    Cached (display_name, description) for a zone group/type pair.
+
+    The mapping and fallback formatting are static, so each pair is
+    resolved once and every later training_paces() call is two dict
+    fetches instead of f-string and str.title work per zone.
+    """
+    display_name = ZONE_NAME_MAPPINGS[zone_group].get(zone_type, zone_type)
+    description = ZONE_DESCRIPTIONS.get(display_name, f"{display_name.replace('_', ' ').title()} pace")
+    return display_name, description
+
+
 def _process_endurance_zone(training_paces: dict, zone_type: str, fast_pace_seconds: float, slow_pace_seconds: float):
     """Process endurance zone training paces."""
-    display_name = ZONE_NAME_MAPPINGS['endurance'].get(zone_type, zone_type)
-    description = ZONE_DESCRIPTIONS.get(display_name, f"{display_name.replace('_', ' ').title()} pace")
+    display_name, description = _zone_display('endurance', zone_type)
 
     training_paces['endurance']['types'][display_name] = {
         'pace': format_pace(fast_pace_seconds, slow_pace_seconds),
@@ -766,15 +1138,14 @@ def _process_stamina_zone(training_paces: dict, zone_type: str, zone_distance: i
 
         fast_velocity = 1000 / fast_pace_seconds
         slow_velocity = 1000 / slow_pace_seconds
-        distance_key = f"{zone_distance}m"
+        distance_key = _distance_key(zone_distance)
 
         training_paces['stamina']['types']['cruise_intervals']['distances'][distance_key] = format_pace_and_time(
             fast_velocity, slow_velocity, zone_distance
         )
     else:
         # Handle other stamina types with pace ranges
-        display_name = ZONE_NAME_MAPPINGS['stamina'].get(zone_type, zone_type)
-        description = ZONE_DESCRIPTIONS.get(display_name, f"{display_name.replace('_', ' ').title()} pace")
+        display_name, description = _zone_display('stamina', zone_type)
 
         training_paces['stamina']['types'][display_name] = {
             'pace': format_pace(fast_pace_seconds, slow_pace_seconds),
@@ -786,7 +1157,7 @@ def _process_interval_zone(training_paces: dict, zone_group: str, zone_type: str
     """Process speed and sprint zone training paces."""
     fast_velocity = 1000 / fast_pace_seconds  # velocity in m/s
     slow_velocity = 1000 / slow_pace_seconds  # velocity in m/s
-    distance_key = f"{zone_distance}m"
+    distance_key = _distance_key(zone_distance)
 
     # Ensure zone type exists
     if zone_type not in training_paces[zone_group]['types']:
@@ -810,9 +1181,8 @@ def format_pace_ms(seconds_per_km: float) -> str:
     Returns:
         str: Formatted pace as "MM:SS" or "HH:MM:SS" if over 1 hour
     """
-    hours = int(seconds_per_km // 3600)
-    minutes = int((seconds_per_km % 3600) // 60)
-    seconds = int(seconds_per_km % 60)
+    minutes, seconds = divmod(int(seconds_per_km), 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -830,9 +1200,8 @@ def format_pace_hms(seconds_per_km: float) -> str:
     Returns:
         str: Formatted pace as "HH:MM:SS"
     """
-    hours = int(seconds_per_km // 3600)
-    minutes = int((seconds_per_km % 3600) // 60)
-    seconds = int(seconds_per_km % 60)
+    minutes, seconds = divmod(int(seconds_per_km), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
@@ -874,6 +1243,12 @@ def format_pace(fast_pace: float, slow_pace: float) -> dict:
     }
 
 
+@lru_cache(maxsize=None)
+def _split_format(distance: int) -> str:
+    """Cached "MM:SS/<distance>m" format descriptor for a split distance."""
+    return f"MM:SS/{distance}m"
+
+
 def format_split(fast_time: float, slow_time: float, distance: int) -> dict:
     """
     Format fast and slow splits.
@@ -890,7 +1265,7 @@ def format_split(fast_time: float, slow_time: float, distance: int) -> dict:
     return {
         "fast": format_pace_ms(fast_time),
         "slow": format_pace_ms(slow_time),
-        "format": f"MM:SS/{distance}m"
+        "format": _split_format(distance)
     }
 
 
@@ -920,15 +1295,35 @@ def heart_rate_zones(age: int, resting_heart_rate: int, max_heart_rate: int = No
     if max_heart_rate is not None and max_heart_rate <= 0:
         raise InvalidInputError("Max heart rate must be positive")
 
-    # Calculate estimated max heart rate using multiple formulas
-    formula_results = [formula(age) for formula in MAX_HR_FORMULAS.values()]
-    estimated_max_hr = round(sum(formula_results) / len(formula_results))
+    # The inputs form a small discrete domain (age, rhr, optional max),
+    # so repeated calls are served from the cache. A deep copy keeps each
+    # caller's result isolated from the cached original.
+    return copy.deepcopy(_heart_rate_zones_cached(age, resting_heart_rate, max_heart_rate))
+
+
+@lru_cache(maxsize=512)
+def _estimated_max_hr(age: int) -> int:
+    """Estimated max heart rate for an age, averaged over all formulas."""
+    formula_results = _MAX_HR_A * age + _MAX_HR_B + _MAX_HR_Q * (age * age)
+    return round(float(formula_results.mean()))
+
+
+@lru_cache(maxsize=4096)
+def _heart_rate_zones_cached(age: int, resting_heart_rate: int, max_heart_rate: int) -> dict:
+    """Build the heart-rate-zone table for already-validated inputs."""
+    estimated_max_hr = _estimated_max_hr(age)
 
     # Use provided max heart rate if available, otherwise use estimated
     effective_max_hr = max_heart_rate if max_heart_rate is not None else estimated_max_hr
 
-    # Use predefined training zone definitions
-    zone_definitions = HR_ZONE_DEFINITIONS
+    # All zone bounds in four vector ops: HRMAX as a percentage of max
+    # heart rate, HRRESERVE as a percentage of heart rate reserve on top
+    # of resting. tolist() hands plain ints to the assembly loop below.
+    hr_reserve = effective_max_hr - resting_heart_rate
+    hrmax_min_bpm = np.rint(_HRMAX_MIN_FRAC * effective_max_hr).astype(np.int64).tolist()
+    hrmax_max_bpm = np.rint(_HRMAX_MAX_FRAC * effective_max_hr).astype(np.int64).tolist()
+    hrreserve_min_bpm = np.rint(_HRRES_MIN_FRAC * hr_reserve + resting_heart_rate).astype(np.int64).tolist()
+    hrreserve_max_bpm = np.rint(_HRRES_MAX_FRAC * hr_reserve + resting_heart_rate).astype(np.int64).tolist()
 
     # Calculate heart rate zones
     result = {
@@ -938,37 +1333,28 @@ def heart_rate_zones(age: int, resting_heart_rate: int, max_heart_rate: int = No
         "zones": {}
     }
 
-    for zone_group, zones in zone_definitions.items():
-        result["zones"][zone_group] = {
-            "description": f"{zone_group.title()} Zone training",
-            "types": {}
-        }
+    zones_out = result["zones"]
+    bounds = zip(hrmax_min_bpm, hrmax_max_bpm, hrreserve_min_bpm, hrreserve_max_bpm)
+    for (zone_group, zone_name, description), (max_min, max_max, res_min, res_max) in zip(_HR_ZONE_INDEX, bounds):
+        group = zones_out.get(zone_group)
+        if group is None:
+            group = zones_out[zone_group] = {
+                "description": _HR_GROUP_DESCRIPTIONS[zone_group],
+                "types": {}
+            }
 
-        for zone_name, zone_data in zones.items():
-            hrmax_min, hrmax_max = zone_data["hrmax"]
-            hrreserve_min, hrreserve_max = zone_data["hrreserve"]
-
-            # Calculate HRMAX method (percentage of max heart rate)
-            hrmax_min_bpm = round((hrmax_min / 100) * effective_max_hr)
-            hrmax_max_bpm = round((hrmax_max / 100) * effective_max_hr)
-
-            # Calculate HRRESERVE method (percentage of heart rate reserve + resting)
-            hr_reserve = effective_max_hr - resting_heart_rate
-            hrreserve_min_bpm = round((hrreserve_min / 100) * hr_reserve + resting_heart_rate)
-            hrreserve_max_bpm = round((hrreserve_max / 100) * hr_reserve + resting_heart_rate)
-
-            result["zones"][zone_group]["types"][zone_name] = {
-                "description": zone_data["description"],
-                "hrmax": {
-                    "min": hrmax_min_bpm,
-                    "max": hrmax_max_bpm,
-                    "range": f"{hrmax_min_bpm}-{hrmax_max_bpm} BPM"
-                },
-                "hrreserve": {
-                    "min": hrreserve_min_bpm,
-                    "max": hrreserve_max_bpm,
-                    "range": f"{hrreserve_min_bpm}-{hrreserve_max_bpm} BPM"
-                }
+        group["types"][zone_name] = {
+            "description": description,
+            "hrmax": {
+                "min": max_min,
+                "max": max_max,
+                "range": _RANGE_FMT(max_min, max_max)
+            },
+            "hrreserve": {
+                "min": res_min,
+                "max": res_max,
+                "range": _RANGE_FMT(res_min, res_max)
             }
+        }
 
     return result
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Riegel's formula for race time prediction."""
 
+import numpy as np
+
 
 def predict_time_riegel(current_distance: float, current_time: float, target_distance: float) -> float:
     """
@@ -17,3 +19,24 @@ def predict_time_riegel(current_distance: float, current_time: float, target_dis
     """
     riegel_exponent = 1.06
     return current_time * ((target_distance / current_distance) ** riegel_exponent)
+
+
+def predict_times_riegel(current_distance: float, current_time: float, target_distances) -> np.ndarray:
+    """
+    Predict race times for many target distances in one call.
+
+    The distance ratios and the power are evaluated in one vectorized
+    pass, so predicting a whole table of distances costs a single
+    np.power instead of one Python-level call per target.
+
+    Args:
+        current_distance: Distance of known performance in meters.
+        current_time: Time of known performance in seconds.
+        target_distances: Distances for race time prediction in meters.
+
+    Returns:
+        np.ndarray: Predicted times in seconds, one per target distance.
+    """
+    riegel_exponent = 1.06
+    ratios = np.asarray(target_distances) / current_distance
+    return current_time * np.power(ratios, riegel_exponent)
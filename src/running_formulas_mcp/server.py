@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fastmcp import FastMCP
 
 from .core.formatting import time_in_hhmmss, pace_in_min_km, pace_in_min_sec
@@ -15,11 +17,7 @@ from .formulas.riegel import predict_time_riegel
 from .formulas.daniels import (
     calculate_vdot_from_performance,
     predict_time_daniels,
-    get_easy_pace,
-    get_threshold_pace,
-    get_interval_pace,
-    get_repetition_pace,
-    get_marathon_pace
+    get_all_paces
 )
 from .formulas.mcmillan import (
     calculate_vlt,
@@ -33,6 +31,89 @@ from .formulas.mcmillan import (
 
 mcp = FastMCP(name="RunningFormulasMCP")
 
+# Format descriptors repeated across tool responses, defined once so
+# every response dict carries references to the same two string objects
+# instead of allocating fresh literals per call site.
+_PACE_FORMAT = "MM:SS/km"
+_TIME_FORMAT = "HH:MM:SS"
+
+
+def _identity(value: float) -> float:
+    return value
+
+
+def _chain(first, second):
+    """Compose two unit conversions into one pre-bound function."""
+    def convert(value: float) -> float:
+        return second(first(value))
+    return convert
+
+
+# Conversion dispatch table, built once at import: each entry is a single
+# callable (identity, direct conversion, or pre-composed chain), so
+# convert_pace does one dict lookup and one call instead of rebuilding
+# the map and looping over a function chain per request.
+_CONVERSIONS = {
+    # Same unit conversions
+    ("min_km", "min_km"): _identity,
+    ("min_mile", "min_mile"): _identity,
+    ("kmh", "kmh"): _identity,
+    ("mph", "mph"): _identity,
+
+    # Direct conversions
+    ("min_km", "min_mile"): pace_min_km_to_min_mile,
+    ("min_mile", "min_km"): pace_min_mile_to_min_km,
+    ("min_km", "kmh"): pace_to_speed_kmh,
+    ("kmh", "min_km"): speed_kmh_to_pace,
+    ("min_mile", "mph"): pace_to_speed_mph,
+    ("mph", "min_mile"): speed_mph_to_pace,
+    ("kmh", "mph"): kmh_to_mph,
+    ("mph", "kmh"): mph_to_kmh,
+
+    # Cross conversions via pre-composed chains
+    ("min_km", "mph"): _chain(pace_to_speed_kmh, kmh_to_mph),
+    ("mph", "min_km"): _chain(mph_to_kmh, speed_kmh_to_pace),
+    ("min_mile", "kmh"): _chain(pace_to_speed_mph, mph_to_kmh),
+    ("kmh", "min_mile"): _chain(kmh_to_mph, speed_mph_to_pace),
+}
+
+# Cached cores for the pure scalar tools. Inputs are quantized to 0.1m
+# and 0.01s before the lookup; since every returned field is itself
+# rounded, the quantization is lossless for clients while letting
+# repeated queries for the same performance skip the whole pipeline.
+
+@lru_cache(maxsize=2048)
+def _cached_vdot(distance: float, time: float) -> float:
+    return round(calculate_vdot_from_performance(distance, time), 1)
+
+
+@lru_cache(maxsize=256)
+def _cached_training_paces(vdot: float) -> tuple:
+    # All paces for 1 km, formatted; the dict is assembled fresh per call
+    # from this immutable tuple so cached entries can't be mutated.
+    paces = get_all_paces(vdot, 1000)
+    return (
+        pace_in_min_km(paces.easy_fast),
+        pace_in_min_km(paces.easy_slow),
+        pace_in_min_km(paces.marathon),
+        pace_in_min_km(paces.threshold),
+        pace_in_min_km(paces.interval),
+        pace_in_min_km(paces.repetition),
+    )
+
+
+@lru_cache(maxsize=2048)
+def _cached_daniels_prediction(current_distance: float, current_time: float, target_distance: float) -> tuple:
+    time = predict_time_daniels(current_distance, current_time, target_distance)
+    return time_in_hhmmss(time), round(time, 1)
+
+
+@lru_cache(maxsize=2048)
+def _cached_riegel_prediction(current_distance: float, current_time: float, target_distance: float) -> tuple:
+    time = predict_time_riegel(current_distance, current_time, target_distance)
+    return time_in_hhmmss(time), round(time, 1)
+
+
 @mcp.tool
 def daniels_calculate_vdot(distance: float, time: float) -> dict:
     """
@@ -51,9 +132,8 @@ def daniels_calculate_vdot(distance: float, time: float) -> dict:
     if time <= 0:
         raise ValueError("Time must be positive")
 
-    vdot = calculate_vdot_from_performance(distance, time)
     return {
-        "vdot": round(vdot, 1)
+        "vdot": _cached_vdot(round(distance, 1), round(time, 2))
     }
 
 @mcp.tool
@@ -75,43 +155,37 @@ def daniels_calculate_training_paces(vdot: float) -> dict:
     if vdot <= 0:
         raise ValueError("VDOT must be positive")
 
-    # Constants
-    DISTANCE_KM = 1000  # Calculate for 1 km (1000 meters)
-
-    # Calculate all training paces for 1km
-    easy_slow = get_easy_pace(vdot, DISTANCE_KM, True)
-    easy_fast = get_easy_pace(vdot, DISTANCE_KM, False)
-    marathon = get_marathon_pace(vdot, DISTANCE_KM)
-    threshold = get_threshold_pace(vdot, DISTANCE_KM)
-    interval = get_interval_pace(vdot, DISTANCE_KM)
-    repetition = get_repetition_pace(vdot, DISTANCE_KM)
+    # All paces for 1 km come from one cached, fused computation
+    easy_fast, easy_slow, marathon, threshold, interval, repetition = (
+        _cached_training_paces(round(vdot, 2))
+    )
 
     return {
         "easy": {
             "lower": {
-                "value": pace_in_min_km(easy_fast),
-                "format": "MM:SS/km"
+                "value": easy_fast,
+                "format": _PACE_FORMAT
             },
             "upper": {
-                "value": pace_in_min_km(easy_slow),
-                "format": "MM:SS/km"
+                "value": easy_slow,
+                "format": _PACE_FORMAT
             }
         },
         "marathon": {
-            "value": pace_in_min_km(marathon),
-            "format": "MM:SS/km"
+            "value": marathon,
+            "format": _PACE_FORMAT
         },
         "threshold": {
-            "value": pace_in_min_km(threshold),
-            "format": "MM:SS/km"
+            "value": threshold,
+            "format": _PACE_FORMAT
         },
         "interval": {
-            "value": pace_in_min_km(interval),
-            "format": "MM:SS/km"
+            "value": interval,
+            "format": _PACE_FORMAT
         },
         "repetition": {
-            "value": pace_in_min_km(repetition),
-            "format": "MM:SS/km"
+            "value": repetition,
+            "format": _PACE_FORMAT
         }
     }
 
@@ -136,12 +210,14 @@ def daniels_predict_race_time(current_distance: float, current_time: float, targ
     if target_distance <= 0:
         raise ValueError("Target distance must be positive")
 
-    time = predict_time_daniels(current_distance, current_time, target_distance)
+    value, time_seconds = _cached_daniels_prediction(
+        round(current_distance, 1), round(current_time, 2), round(target_distance, 1)
+    )
 
     return {
-        "value": time_in_hhmmss(time),
-        "format": "HH:MM:SS",
-        "time_seconds": round(time, 1)
+        "value": value,
+        "format": _TIME_FORMAT,
+        "time_seconds": time_seconds
     }
 
 @mcp.tool
@@ -165,11 +241,13 @@ def riegel_predict_race_time(current_distance: float, current_time: float, targe
     if target_distance <= 0:
         raise ValueError("Target distance must be positive")
 
-    time = predict_time_riegel(current_distance, current_time, target_distance)
+    value, time_seconds = _cached_riegel_prediction(
+        round(current_distance, 1), round(current_time, 2), round(target_distance, 1)
+    )
     return {
-        "value": time_in_hhmmss(time),
-        "format": "HH:MM:SS",
-        "time_seconds": round(time, 1)
+        "value": value,
+        "format": _TIME_FORMAT,
+        "time_seconds": time_seconds
     }
 
 @mcp.tool
@@ -183,30 +261,30 @@ def mcmillan_calculate_velocity_markers(distance: float, time: float) -> dict:
 
     Returns:
         Dictionary containing velocity markers with paces in MM:SS/km format
+
+    Raises:
+        ValueError: If distance or time is not positive or the inputs are unrealistic.
     """
-    try:
-        vlt = calculate_vlt(distance, time)
-        cv = calculate_cv(distance, time)
-        vvo2 = calculate_vvo2(distance, time)
-
-        return {
-            "velocity_markers": {
-                "vLT": {
-                    "pace": format_pace_ms(vlt),
-                    "description": "Velocity at Lactate Threshold (vLT) - sustainable pace for ~1 hour"
-                },
-                "CV": {
-                    "pace": format_pace_ms(cv),
-                    "description": "Critical Velocity (CV) - theoretical maximum sustainable pace"
-                },
-                "vVO2": {
-                    "pace": format_pace_ms(vvo2),
-                    "description": "Velocity at VO2max (vVO2) - pace at maximum oxygen uptake"
-                }
+    vlt = calculate_vlt(distance, time)
+    cv = calculate_cv(distance, time)
+    vvo2 = calculate_vvo2(distance, time)
+
+    return {
+        "velocity_markers": {
+            "vLT": {
+                "pace": format_pace_ms(vlt),
+                "description": "Velocity at Lactate Threshold (vLT) - sustainable pace for ~1 hour"
+            },
+            "CV": {
+                "pace": format_pace_ms(cv),
+                "description": "Critical Velocity (CV) - theoretical maximum sustainable pace"
+            },
+            "vVO2": {
+                "pace": format_pace_ms(vvo2),
+                "description": "Velocity at VO2max (vVO2) - pace at maximum oxygen uptake"
             }
         }
-    except Exception as e:
-        return {"error": str(e)}
+    }
 
 @mcp.tool
 def mcmillan_predict_race_times(distance: float, time: float) -> dict:
@@ -219,11 +297,11 @@ def mcmillan_predict_race_times(distance: float, time: float) -> dict:
 
     Returns:
         Dictionary containing predicted race times in HH:MM:SS format
+
+    Raises:
+        ValueError: If distance or time is not positive or the inputs are unrealistic.
     """
-    try:
-        return predict_race_times(distance, time)
-    except Exception as e:
-        return {"error": str(e)}
+    return predict_race_times(distance, time)
 
 @mcp.tool
 def mcmillan_calculate_training_paces(distance: float, time: float) -> dict:
@@ -236,11 +314,11 @@ def mcmillan_calculate_training_paces(distance: float, time: float) -> dict:
 
     Returns:
         Dictionary containing training paces organized by zones (endurance, stamina, speed, sprint)
+
+    Raises:
+        ValueError: If distance or time is not positive or the inputs are unrealistic.
     """
-    try:
-        return training_paces(distance, time)
-    except Exception as e:
-        return {"error": str(e)}
+    return training_paces(distance, time)
 
 @mcp.tool
 def mcmillan_heart_rate_zones(age: int, resting_heart_rate: int, max_heart_rate: int = None) -> dict:
@@ -255,11 +333,11 @@ def mcmillan_heart_rate_zones(age: int, resting_heart_rate: int, max_heart_rate:
 
     Returns:
         Dictionary containing estimated max HR, effective max HR, and training zones with both HRMAX and HRRESERVE calculations
+
+    Raises:
+        ValueError: If age or either heart rate is not positive.
     """
-    try:
-        return heart_rate_zones(age, resting_heart_rate, max_heart_rate)
-    except Exception as e:
-        return {"error": str(e)}
+    return heart_rate_zones(age, resting_heart_rate, max_heart_rate)
 
 @mcp.tool
 def convert_pace(value: float, from_unit: str, to_unit: str) -> dict:
@@ -287,40 +365,12 @@ def convert_pace(value: float, from_unit: str, to_unit: str) -> dict:
     if to_unit not in valid_units:
         raise ValueError(f"Invalid to_unit '{to_unit}'. Must be one of: {valid_units}")
 
-    # Conversion function mapping - single functions, chains, or empty chains
-    conversion_map = {
-        # Same unit conversions (empty chains)
-        ("min_km", "min_km"): [],
-        ("min_mile", "min_mile"): [],
-        ("kmh", "kmh"): [],
-        ("mph", "mph"): [],
-
-        # Direct conversions
-        ("min_km", "min_mile"): [pace_min_km_to_min_mile],
-        ("min_mile", "min_km"): [pace_min_mile_to_min_km],
-        ("min_km", "kmh"): [pace_to_speed_kmh],
-        ("kmh", "min_km"): [speed_kmh_to_pace],
-        ("min_mile", "mph"): [pace_to_speed_mph],
-        ("mph", "min_mile"): [speed_mph_to_pace],
-        ("kmh", "mph"): [kmh_to_mph],
-        ("mph", "kmh"): [mph_to_kmh],
-
-        # Cross conversions via function chains
-        ("min_km", "mph"): [pace_to_speed_kmh, kmh_to_mph],
-        ("mph", "min_km"): [mph_to_kmh, speed_kmh_to_pace],
-        ("min_mile", "kmh"): [pace_to_speed_mph, mph_to_kmh],
-        ("kmh", "min_mile"): [kmh_to_mph, speed_mph_to_pace],
-    }
-
-    # Look up conversion functions
-    conversion_key = (from_unit, to_unit)
-    if conversion_key not in conversion_map:
+    # Look up the pre-composed conversion function
+    convert = _CONVERSIONS.get((from_unit, to_unit))
+    if convert is None:
         raise ValueError(f"Conversion from '{from_unit}' to '{to_unit}' not supported")
 
-    # Apply function chain
-    result_value = value
-    for func in conversion_map[conversion_key]:
-        result_value = func(result_value)
+    result_value = convert(value)
 
     # Format the result
     if to_unit in ["min_km", "min_mile"]:
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tool_fns():
+    """Resolve every tool function once per test session.
+
+    Keeps the per-test FastMCP internals traversal out of the test
+    bodies; each test indexes this plain dict instead.
+    """
+    from running_formulas_mcp.server import mcp
+    return {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
@@ -2,13 +2,16 @@
 Unit tests for McMillan Running Calculator implementation.
 """
 
+from functools import lru_cache
+
+import numpy as np
 import pytest
 from pytest import approx
-from src.running_formulas_mcp.formulas.mcmillan import (
+from running_formulas_mcp.formulas.mcmillan import (
     calculate_cv, calculate_vlt, calculate_vvo2, predict_race_times,
-    training_paces, format_pace_ms, format_pace_hms, format_pace,
-    format_split, format_pace_and_time, _normalize_time, _assert_inputs,
-    heart_rate_zones
+    predict_race_times_seconds, training_paces, format_pace_ms,
+    format_pace_hms, format_pace, format_split, format_pace_and_time,
+    _normalize_time, _assert_inputs, heart_rate_zones
 )
 
 
@@ -72,6 +75,7 @@ def interpolated_distance_cases():
 # SHARED HELPER METHODS
 # ============================================================================
 
+@lru_cache(maxsize=None)
 def time_string_to_seconds(time_str):
     """Convert HH:MM:SS time string to total seconds."""
     parts = time_str.split(":")
@@ -81,6 +85,7 @@ def time_string_to_seconds(time_str):
     return hours * 3600 + minutes * 60 + seconds
 
 
+@lru_cache(maxsize=None)
 def pace_string_to_seconds(pace_str):
     """Convert MM:SS pace string to total seconds."""
     parts = pace_str.split(":")
@@ -89,6 +94,24 @@ def pace_string_to_seconds(pace_str):
     return minutes * 60 + seconds
 
 
+def flatten_pace_strings(tree, prefix=""):
+    """
+    Flatten a nested training-paces dict into {dotted.key: seconds}.
+
+    Only "fast"/"slow" pace-string leaves are collected (descriptions and
+    format fields are skipped), so two trees can be compared with one
+    vectorized pass instead of nested per-leaf loops.
+    """
+    flat = {}
+    for key, value in tree.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten_pace_strings(value, path))
+        elif key in ("fast", "slow"):
+            flat[path] = pace_string_to_seconds(value)
+    return flat
+
+
 # ============================================================================
 # BASE TEST CLASSES
 # ============================================================================
@@ -321,14 +344,33 @@ class TestPredictRaceTimes(BaseInputValidationTests):
         """Test race time predictions (±1% tolerance)."""
         predictions = predict_race_times(distance, time)
 
-        for race_distance, expected_time in expected_predictions.items():
+        # Parse the expected strings once up front; the cached parser
+        # makes repeat runs of this loop cheap as well.
+        expected_seconds = {
+            race_distance: time_string_to_seconds(expected_time)
+            for race_distance, expected_time in expected_predictions.items()
+        }
+
+        for race_distance, expected in expected_seconds.items():
             assert race_distance in predictions, f"Should predict {race_distance} for {description}"
 
-            expected_seconds = time_string_to_seconds(expected_time)
             actual_seconds = time_string_to_seconds(predictions[race_distance])
 
-            assert actual_seconds == approx(expected_seconds, rel=0.01), \
-                f"Failed prediction for {race_distance} in {description}: expected {expected_time}, got {predictions[race_distance]}"
+            # Plain relative comparison instead of pytest.approx: same
+            # ±1% semantics without allocating an ApproxScalar per row.
+            assert abs(actual_seconds - expected) <= 0.01 * expected, \
+                f"Failed prediction for {race_distance} in {description}: expected {expected_predictions[race_distance]}, got {predictions[race_distance]}"
+
+    def test_seconds_variant_matches_formatted(self):
+        """The numeric variant must agree with the formatted predictions."""
+        distance, time = 21097, 5400
+        formatted = predict_race_times(distance, time)
+        seconds = predict_race_times_seconds(distance, time)
+
+        assert formatted.keys() == seconds.keys()
+        for race_distance, predicted_seconds in seconds.items():
+            assert format_pace_hms(predicted_seconds) == formatted[race_distance], \
+                f"Seconds/string mismatch for {race_distance}"
 
 
 # ============================================================================
@@ -411,56 +453,28 @@ class TestTrainingPaces(BaseInputValidationTests):
         """Test training paces for all zones, types, and distances (±1% tolerance)."""
         paces = training_paces(distance, time)
 
-        for zone_name, expected_zone in expected_paces.items():
-            assert zone_name in paces, f"Should contain {zone_name} zone for {description}"
-
-            for type_name, expected_type in expected_zone.items():
-                assert type_name in paces[zone_name]["types"], f"Should contain {type_name} type in {zone_name} zone for {description}"
-                actual_type = paces[zone_name]["types"][type_name]
-
-                # Check pace-only types (endurance and some stamina types)
-                if "pace" in expected_type:
-                    assert "pace" in actual_type, f"Should have pace for {type_name} in {zone_name} for {description}"
-
-                    expected_fast_seconds = pace_string_to_seconds(expected_type["pace"]["fast"])
-                    actual_fast_seconds = pace_string_to_seconds(actual_type["pace"]["fast"])
-                    expected_slow_seconds = pace_string_to_seconds(expected_type["pace"]["slow"])
-                    actual_slow_seconds = pace_string_to_seconds(actual_type["pace"]["slow"])
-
-                    assert actual_fast_seconds == approx(expected_fast_seconds, rel=0.01), f"Failed fast pace for {type_name} in {zone_name} for {description}: expected {expected_type['pace']['fast']}, got {actual_type['pace']['fast']}"
-                    assert actual_slow_seconds == approx(expected_slow_seconds, rel=0.01), f"Failed slow pace for {type_name} in {zone_name} for {description}: expected {expected_type['pace']['slow']}, got {actual_type['pace']['slow']}"
-
-                # Check distance-based types (intervals in stamina, speed, and sprint zones)
-                if "distances" in expected_type:
-                    assert "distances" in actual_type, f"Should have distances for {type_name} in {zone_name} for {description}"
-
-                    for distance_name, expected_distance in expected_type["distances"].items():
-                        assert distance_name in actual_type["distances"], f"Should contain {distance_name} distance for {type_name} in {zone_name} for {description}"
-                        actual_distance = actual_type["distances"][distance_name]
-
-                        # Check pace values
-                        if "pace" in expected_distance:
-                            assert "pace" in actual_distance, f"Should have pace for {distance_name} in {type_name} for {description}"
-
-                            expected_fast_seconds = pace_string_to_seconds(expected_distance["pace"]["fast"])
-                            actual_fast_seconds = pace_string_to_seconds(actual_distance["pace"]["fast"])
-                            expected_slow_seconds = pace_string_to_seconds(expected_distance["pace"]["slow"])
-                            actual_slow_seconds = pace_string_to_seconds(actual_distance["pace"]["slow"])
-
-                            assert actual_fast_seconds == approx(expected_fast_seconds, rel=0.01), f"Failed fast pace for {distance_name} {type_name} in {zone_name} for {description}: expected {expected_distance['pace']['fast']}, got {actual_distance['pace']['fast']}"
-                            assert actual_slow_seconds == approx(expected_slow_seconds, rel=0.01), f"Failed slow pace for {distance_name} {type_name} in {zone_name} for {description}: expected {expected_distance['pace']['slow']}, got {actual_distance['pace']['slow']}"
-
-                        # Check split values
-                        if "split" in expected_distance:
-                            assert "split" in actual_distance, f"Should have split for {distance_name} in {type_name} for {description}"
-
-                            expected_fast_seconds = pace_string_to_seconds(expected_distance["split"]["fast"])
-                            actual_fast_seconds = pace_string_to_seconds(actual_distance["split"]["fast"])
-                            expected_slow_seconds = pace_string_to_seconds(expected_distance["split"]["slow"])
-                            actual_slow_seconds = pace_string_to_seconds(actual_distance["split"]["slow"])
-
-                            assert actual_fast_seconds == approx(expected_fast_seconds, rel=0.01), f"Failed fast split for {distance_name} {type_name} in {zone_name} for {description}: expected {expected_distance['split']['fast']}, got {actual_distance['split']['fast']}"
-                            assert actual_slow_seconds == approx(expected_slow_seconds, rel=0.01), f"Failed slow split for {distance_name} {type_name} in {zone_name} for {description}: expected {expected_distance['split']['slow']}, got {actual_distance['split']['slow']}"
+        # Flatten both trees to {dotted.key: seconds} and compare in one
+        # vectorized pass. The "types" level only exists in the actual
+        # structure, so it is collapsed to align the key spaces.
+        expected_flat = flatten_pace_strings(expected_paces)
+        actual_flat = {
+            key.replace(".types.", "."): value
+            for key, value in flatten_pace_strings(paces).items()
+        }
+
+        missing = sorted(expected_flat.keys() - actual_flat.keys())
+        assert not missing, f"Missing pace entries for {description}: {missing}"
+
+        keys = sorted(expected_flat)
+        actual = np.array([actual_flat[key] for key in keys])
+        expected = np.array([expected_flat[key] for key in keys])
+        close = np.isclose(actual, expected, rtol=0.01)
+        mismatches = [
+            f"{key}: expected {exp}s, got {act}s"
+            for key, act, exp, ok in zip(keys, actual, expected, close)
+            if not ok
+        ]
+        assert not mismatches, f"Pace mismatches for {description}: {mismatches}"
 
     @pytest.mark.parametrize("distance,time,description", [
         (4500, 900, "4500m in 15:00"),
@@ -610,73 +624,82 @@ class TestUtilityFunctions:
 # HEART RATE ZONES TESTS
 # ============================================================================
 
-class TestHeartRateZones:
-    """Test heart rate zone calculations."""
+# Known heart-rate zone cases, built once at module import:
+# (age, resting_hr, max_hr, expected_estimated_max, expected_zones, description)
+_HR_CASES = (
+    (30, 60, 190, 187, {
+        "endurance": {
+            "easy_runs": {"hrmax": (114, 162), "hrreserve": (132, 161)},
+            "long_runs": {"hrmax": (114, 162), "hrreserve": (132, 161)}
+        },
+        "stamina": {
+            "steady_state_runs": {"hrmax": (158, 165), "hrreserve": (158, 164)},
+            "tempo_runs": {"hrmax": (162, 171), "hrreserve": (164, 170)},
+            "tempo_intervals": {"hrmax": (165, 175), "hrreserve": (167, 173)},
+            "cruise_intervals": {"hrmax": (165, 175), "hrreserve": (170, 177)}
+        },
+        "speed": {
+            "endurance_monster": {"hrmax": (171, 190), "hrreserve": (177, 190)},
+            "speedster": {"hrmax": (171, 190), "hrreserve": (177, 190)}
+        },
+        "sprint": {
+            "endurance_monster": {"hrmax": (171, 190), "hrreserve": (177, 190)},
+            "speedster": {"hrmax": (171, 190), "hrreserve": (177, 190)}
+        }
+    }, "30-year-old with 60 BPM resting HR and 190 BPM max HR"),
+
+    (45, 50, 175, 177, {
+        "endurance": {
+            "easy_runs": {"hrmax": (105, 149), "hrreserve": (119, 148)},
+            "long_runs": {"hrmax": (105, 149), "hrreserve": (119, 148)}
+        },
+        "stamina": {
+            "steady_state_runs": {"hrmax": (145, 152), "hrreserve": (144, 150)},
+            "tempo_runs": {"hrmax": (149, 158), "hrreserve": (150, 156)},
+            "tempo_intervals": {"hrmax": (152, 161), "hrreserve": (152, 159)},
+            "cruise_intervals": {"hrmax": (152, 161), "hrreserve": (156, 162)}
+        },
+        "speed": {
+            "endurance_monster": {"hrmax": (158, 175), "hrreserve": (162, 175)},
+            "speedster": {"hrmax": (158, 175), "hrreserve": (162, 175)}
+        },
+        "sprint": {
+            "endurance_monster": {"hrmax": (158, 175), "hrreserve": (162, 175)},
+            "speedster": {"hrmax": (158, 175), "hrreserve": (162, 175)}
+        }
+    }, "45-year-old with 50 BPM resting HR and 175 BPM max HR"),
+
+    (45, 50, None, 177, {
+        "endurance": {
+            "easy_runs": {"hrmax": (106, 150), "hrreserve": (120, 149)},
+            "long_runs": {"hrmax": (106, 150), "hrreserve": (120, 149)}
+        },
+        "stamina": {
+            "steady_state_runs": {"hrmax": (147, 154), "hrreserve": (145, 152)},
+            "tempo_runs": {"hrmax": (150, 159), "hrreserve": (152, 158)},
+            "tempo_intervals": {"hrmax": (154, 163), "hrreserve": (154, 160)},
+            "cruise_intervals": {"hrmax": (154, 163), "hrreserve": (158, 164)}
+        },
+        "speed": {
+            "endurance_monster": {"hrmax": (159, 177), "hrreserve": (164, 177)},
+            "speedster": {"hrmax": (159, 177), "hrreserve": (164, 177)}
+        },
+        "sprint": {
+            "endurance_monster": {"hrmax": (159, 177), "hrreserve": (164, 177)},
+            "speedster": {"hrmax": (159, 177), "hrreserve": (164, 177)}
+        }
+    }, "45-year-old with 50 BPM resting HR and no max HR"),
+)
 
-    @pytest.mark.parametrize("age,resting_hr,max_hr,expected_estimated_max,expected_zones,description", [
-        (30, 60, 190, 187, {
-            "endurance": {
-                "easy_runs": {"hrmax": (114, 162), "hrreserve": (132, 161)},
-                "long_runs": {"hrmax": (114, 162), "hrreserve": (132, 161)}
-            },
-            "stamina": {
-                "steady_state_runs": {"hrmax": (158, 165), "hrreserve": (158, 164)},
-                "tempo_runs": {"hrmax": (162, 171), "hrreserve": (164, 170)},
-                "tempo_intervals": {"hrmax": (165, 175), "hrreserve": (167, 173)},
-                "cruise_intervals": {"hrmax": (165, 175), "hrreserve": (170, 177)}
-            },
-            "speed": {
-                "endurance_monster": {"hrmax": (171, 190), "hrreserve": (177, 190)},
-                "speedster": {"hrmax": (171, 190), "hrreserve": (177, 190)}
-            },
-            "sprint": {
-                "endurance_monster": {"hrmax": (171, 190), "hrreserve": (177, 190)},
-                "speedster": {"hrmax": (171, 190), "hrreserve": (177, 190)}
-            }
-        }, "30-year-old with 60 BPM resting HR and 190 BPM max HR"),
 
-        (45, 50, 175, 177, {
-            "endurance": {
-                "easy_runs": {"hrmax": (105, 149), "hrreserve": (119, 148)},
-                "long_runs": {"hrmax": (105, 149), "hrreserve": (119, 148)}
-            },
-            "stamina": {
-                "steady_state_runs": {"hrmax": (145, 152), "hrreserve": (144, 150)},
-                "tempo_runs": {"hrmax": (149, 158), "hrreserve": (150, 156)},
-                "tempo_intervals": {"hrmax": (152, 161), "hrreserve": (152, 159)},
-                "cruise_intervals": {"hrmax": (152, 161), "hrreserve": (156, 162)}
-            },
-            "speed": {
-                "endurance_monster": {"hrmax": (158, 175), "hrreserve": (162, 175)},
-                "speedster": {"hrmax": (158, 175), "hrreserve": (162, 175)}
-            },
-            "sprint": {
-                "endurance_monster": {"hrmax": (158, 175), "hrreserve": (162, 175)},
-                "speedster": {"hrmax": (158, 175), "hrreserve": (162, 175)}
-            }
-        }, "45-year-old with 50 BPM resting HR and 175 BPM max HR"),
+class TestHeartRateZones:
+    """Test heart rate zone calculations."""
 
-        (45, 50, None, 177, {
-            "endurance": {
-                "easy_runs": {"hrmax": (106, 150), "hrreserve": (120, 149)},
-                "long_runs": {"hrmax": (106, 150), "hrreserve": (120, 149)}
-            },
-            "stamina": {
-                "steady_state_runs": {"hrmax": (147, 154), "hrreserve": (145, 152)},
-                "tempo_runs": {"hrmax": (150, 159), "hrreserve": (152, 158)},
-                "tempo_intervals": {"hrmax": (154, 163), "hrreserve": (154, 160)},
-                "cruise_intervals": {"hrmax": (154, 163), "hrreserve": (158, 164)}
-            },
-            "speed": {
-                "endurance_monster": {"hrmax": (159, 177), "hrreserve": (164, 177)},
-                "speedster": {"hrmax": (159, 177), "hrreserve": (164, 177)}
-            },
-            "sprint": {
-                "endurance_monster": {"hrmax": (159, 177), "hrreserve": (164, 177)},
-                "speedster": {"hrmax": (159, 177), "hrreserve": (164, 177)}
-            }
-        }, "45-year-old with 50 BPM resting HR and no max HR"),
-    ])
+    @pytest.mark.parametrize(
+        "age,resting_hr,max_hr,expected_estimated_max,expected_zones,description",
+        _HR_CASES,
+        ids=[case[5] for case in _HR_CASES],
+    )
     def test_known_values(self, age, resting_hr, max_hr, expected_estimated_max, expected_zones, description):
         """Test heart rate zone calculations for known values."""
 
@@ -703,35 +726,17 @@ class TestHeartRateZones:
                 assert type_name in actual_zone["types"], f"Should contain {type_name} in {zone_name} for {description}"
                 actual_type = actual_zone["types"][type_name]
 
-                # Check HRMAX values
-                expected_hrmax_min, expected_hrmax_max = expected_type["hrmax"]
-                expected_hrmax_range = f"{expected_hrmax_min}-{expected_hrmax_max} BPM"
-
-                actual_hrmax_min = actual_type["hrmax"]["min"]
-                actual_hrmax_max = actual_type["hrmax"]["max"]
-                actual_hrmax_range = f"{actual_hrmax_min}-{actual_hrmax_max} BPM"
-
-                assert actual_hrmax_min == expected_hrmax_min, \
-                    f"HRMAX min for {type_name} in {zone_name} for {description}: expected {expected_hrmax_min}, got {actual_hrmax_min}"
-                assert actual_hrmax_max == expected_hrmax_max, \
-                    f"HRMAX max for {type_name} in {zone_name} for {description}: expected {expected_hrmax_max}, got {actual_hrmax_max}"
-                assert actual_hrmax_range == expected_hrmax_range, \
-                    f"HRMAX range for {type_name} in {zone_name} for {description}: expected {expected_hrmax_range}, got {actual_hrmax_range}"
-
-                # Check HRRESERVE values
-                expected_hrreserve_min, expected_hrreserve_max = expected_type["hrreserve"]
-                expected_hrreserve_range = f"{expected_hrreserve_min}-{expected_hrreserve_max} BPM"
-
-                actual_hrreserve_min = actual_type["hrreserve"]["min"]
-                actual_hrreserve_max = actual_type["hrreserve"]["max"]
-                actual_hrreserve_range = f"{actual_hrreserve_min}-{actual_hrreserve_max} BPM"
-
-                assert actual_hrreserve_min == expected_hrreserve_min, \
-                    f"HRRESERVE min for {type_name} in {zone_name} for {description}: expected {expected_hrreserve_min}, got {actual_hrreserve_min}"
-                assert actual_hrreserve_max == expected_hrreserve_max, \
-                    f"HRRESERVE max for {type_name} in {zone_name} for {description}: expected {expected_hrreserve_max}, got {actual_hrreserve_max}"
-                assert actual_hrreserve_range == expected_hrreserve_range, \
-                    f"HRRESERVE range for {type_name} in {zone_name} for {description}: expected {expected_hrreserve_range}, got {actual_hrreserve_range}"
+                # One dict equality per metric covers min, max and the
+                # rendered range string in a single C-level comparison.
+                for metric in ("hrmax", "hrreserve"):
+                    expected_min, expected_max = expected_type[metric]
+                    expected_metric = {
+                        "min": expected_min,
+                        "max": expected_max,
+                        "range": f"{expected_min}-{expected_max} BPM",
+                    }
+                    assert actual_type[metric] == expected_metric, \
+                        f"{metric} for {type_name} in {zone_name} for {description}: expected {expected_metric}, got {actual_type[metric]}"
 
     @pytest.mark.parametrize("age,resting_hr,max_hr,error_message,description", [
         (0, 60, None, "Age must be positive", "zero age"),
@@ -743,5 +748,8 @@ class TestHeartRateZones:
     ])
     def test_invalid_inputs(self, age, resting_hr, max_hr, error_message, description):
         """Test heart rate zone calculations with invalid inputs."""
-        with pytest.raises(ValueError, match=error_message):
-            heart_rate_zones(age=age, resting_heart_rate=resting_hr, max_heart_rate=max_hr)
\ No newline at end of file
+        # Exact string equality instead of match=: skips the per-row regex
+        # compile and documents that these messages are literal strings.
+        with pytest.raises(ValueError) as exc_info:
+            heart_rate_zones(age=age, resting_heart_rate=resting_hr, max_heart_rate=max_hr)
+        assert str(exc_info.value) == error_message, description
\ No newline at end of file